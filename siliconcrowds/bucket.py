@@ -1,37 +1,88 @@
 import os
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
-from supabase import Client, create_client
+import httpx
+from supabase import Client, ClientOptions, create_client
 
-load_dotenv()
+from siliconcrowds.env import load_env
 
+# Signed URLs are reused only for the first half of their lifetime, so callers
+# always get at least expires_in / 2 seconds of validity.
+_SIGNED_URL_REUSE_FRACTION = 0.5
+# Keyed by client first so a Bucket on another client/project never sees these URLs.
+_signed_url_cache: weakref.WeakKeyDictionary[
+    Client, dict[tuple[str, str, int], tuple[float, dict[str, str]]]
+] = weakref.WeakKeyDictionary()
 
-def get_supabase_client() -> Client:
+# Passing our own httpx client drops Supabase's per-service timeouts, so the
+# longest of them (PostgREST's 120s) is applied to the shared client instead.
+_HTTP_TIMEOUT = 120
+_HTTP_MAX_KEEPALIVE = 20
+
+
+@lru_cache(maxsize=1)
+def _client() -> Client:
+    load_env()
     supabase_url = os.environ.get("SUPABASE_URL")
     if not supabase_url:
         raise ValueError("SUPABASE_URL is not set")
     supabase_key = os.environ.get("SUPABASE_KEY")
     if not supabase_key:
         raise ValueError("SUPABASE_KEY is not set")
-    return create_client(supabase_url, supabase_key)
+    http_client = httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        timeout=httpx.Timeout(_HTTP_TIMEOUT),
+        limits=httpx.Limits(max_keepalive_connections=_HTTP_MAX_KEEPALIVE),
+    )
+    return create_client(
+        supabase_url, supabase_key, options=ClientOptions(httpx_client=http_client)
+    )
+
+
+def get_supabase_client() -> Client:
+    return _client()
+
+
+def clear_signed_url_cache() -> None:
+    _signed_url_cache.clear()
 
 
 class Bucket:
-    def __init__(self, bucket_name: str) -> None:
+    def __init__(self, bucket_name: str, client: Client | None = None) -> None:
         self.bucket_name = bucket_name
-        self.client = get_supabase_client()
+        self.client = client or get_supabase_client()
 
     def list_files(
         self,
         path: str,
         sort_by: dict | None = None,
+        page_size: int = 1000,
     ) -> list[dict]:
         default_sort = {"column": "name", "order": "desc"}
-        response = self.client.storage.from_(self.bucket_name).list(path, sort_by or default_sort)
-        return response if isinstance(response, list) else []
+        files: list[dict] = []
+        offset = 0
+        while True:
+            response = self.client.storage.from_(self.bucket_name).list(
+                path,
+                {"limit": page_size, "offset": offset, "sortBy": sort_by or default_sort},
+            )
+            page = response if isinstance(response, list) else []
+            files.extend(page)
+            if len(page) < page_size:
+                return files
+            offset += page_size
 
     def list_public_urls(self, path: str, expires_in: int = 60 * 30) -> dict[str, str]:
+        client_cache = _signed_url_cache.setdefault(self.client, {})
+        key = (self.bucket_name, path, expires_in)
+        cached = client_cache.get(key)
+        if cached and time.monotonic() < cached[0]:
+            return dict(cached[1])
+
         files = self.list_files(path)
         if not files:
             raise ValueError("No files found")
@@ -39,10 +90,13 @@ class Bucket:
         response = self.client.storage.from_(self.bucket_name).create_signed_urls(
             filenames, expires_in
         )
-        return {
+        public_urls = {
             Path(file["name"]).stem: url["signedURL"]
             for file, url in zip(files, response)
         }
+        fresh_until = time.monotonic() + expires_in * _SIGNED_URL_REUSE_FRACTION
+        client_cache[key] = (fresh_until, public_urls)
+        return dict(public_urls)
 
 
 if __name__ == "__main__":
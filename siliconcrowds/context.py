@@ -1,18 +1,22 @@
-from pydantic import BaseModel
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from siliconcrowds.bucket import Bucket
 from siliconcrowds.database import Database
 
-class ContextPrompt(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ContextPrompt:
     transcript: str
     image_url: str | None
 
-class Answer(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Answer:
     norways_answer: str
     actual_outcome: str | None
     answer_type: str | None
 
-class Context(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Context:
     id: str
     question_id: str
     prompt: ContextPrompt
@@ -21,27 +25,24 @@ class Context(BaseModel):
 class Contextual:
     def __init__(self, bucket_name: str = "pilot_images", path: str = "pilot_images") -> None:
         database = Database()
-        questions = database.get_questions()
-
         bucket = Bucket(bucket_name)
-        signed_urls = bucket.list_public_urls(path=path)
 
-        self.contexts: dict[str, Context] = {
-            question.question_id: Context(
-                id=str(question.id),
-                question_id=question.question_id,
-                prompt=ContextPrompt(
-                    transcript=question.transcript,
-                    image_url=signed_urls.get(question.question_id),
-                ),
-                answer=Answer(
-                    norways_answer=question.norways_answer,
-                    actual_outcome=question.actual_outcome,
-                    answer_type=question.answer_type,
-                ),
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            questions_future = executor.submit(database.get_questions)
+            signed_urls_future = executor.submit(bucket.list_public_urls, path=path)
+            questions = questions_future.result()
+            signed_urls = signed_urls_future.result()
+
+        get_signed_url = signed_urls.get
+        self.contexts: dict[str, Context] = {}
+        for question in questions:
+            question_id = question.question_id
+            self.contexts[question_id] = Context(
+                str(question.id),
+                question_id,
+                ContextPrompt(question.transcript, get_signed_url(question_id)),
+                Answer(question.norways_answer, question.actual_outcome, question.answer_type),
             )
-            for question in questions
-        }
 
     def __len__(self) -> int:
         return len(self.contexts)
@@ -1,26 +1,46 @@
+from pydantic import TypeAdapter
+from supabase import Client
+
 from siliconcrowds.bucket import get_supabase_client
 from siliconcrowds.prompt import Persona, Prompt, Question
 
+_QUESTIONS_ADAPTER = TypeAdapter(list[Question])
+
+_PERSONA_COLS = ",".join(Persona.model_fields)
+_PROMPT_COLS = ",".join(Prompt.model_fields)
+_QUESTION_COLS = ",".join(Question.model_fields)
+
 
 class Database:
-    def __init__(self) -> None:
-        self.client = get_supabase_client()
+    def __init__(self, client: Client | None = None) -> None:
+        self.client = client or get_supabase_client()
 
     def get_personas(self, table_name: str = "personas_representative") -> list[Persona]:
-        response = self.client.table(table_name).select("*").execute()
-        return [Persona.model_validate(persona) for persona in response.data]
+        response = self.client.table(table_name).select(_PERSONA_COLS).execute()
+        return [Persona.model_construct(**persona) for persona in response.data]
 
     def get_prompts_by_category(
         self, category: str, table_name: str = "prompts"
     ) -> dict[str, Prompt]:
         response = (
-            self.client.table(table_name).select("*").eq("category", category).execute()
+            self.client.table(table_name).select(_PROMPT_COLS).eq("category", category).execute()
         )
         return {
-            prompt["template_name"]: Prompt.model_validate(prompt)
+            prompt["template_name"]: Prompt.model_construct(**prompt)
             for prompt in response.data
         }
 
+    def get_prompts_by_categories(
+        self, categories: list[str], table_name: str = "prompts"
+    ) -> dict[str, dict[str, Prompt]]:
+        response = (
+            self.client.table(table_name).select(_PROMPT_COLS).in_("category", categories).execute()
+        )
+        prompts: dict[str, dict[str, Prompt]] = {category: {} for category in categories}
+        for prompt in response.data:
+            prompts[prompt["category"]][prompt["template_name"]] = Prompt.model_construct(**prompt)
+        return prompts
+
     def get_baseline_prompts(self, table_name: str = "prompts") -> dict[str, Prompt]:
         return self.get_prompts_by_category("baseline", table_name)
 
@@ -31,8 +51,8 @@ class Database:
         return self.get_prompts_by_category("specific_persona", table_name)
 
     def get_questions(self, table_name: str = "questions") -> list[Question]:
-        response = self.client.table(table_name).select("*").execute()
-        return [Question.model_validate(question) for question in response.data]
+        response = self.client.table(table_name).select(_QUESTION_COLS).execute()
+        return _QUESTIONS_ADAPTER.validate_python(response.data)
 
 
 if __name__ == "__main__":
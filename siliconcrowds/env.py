@@ -0,0 +1,11 @@
+_ENV_LOADED = False
+
+
+def load_env() -> None:
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _ENV_LOADED = True
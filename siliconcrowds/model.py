@@ -1,15 +1,20 @@
+import asyncio
 import os
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import from_json
 
-load_dotenv()
+from siliconcrowds.env import load_env
 
-from fireworks import Fireworks  # noqa: E402
+if TYPE_CHECKING:
+    from fireworks import AsyncFireworks
 
 class Config(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     temperature: float = Field(default=0.1)
 
 
@@ -24,6 +29,11 @@ class MessageType(str, Enum):
     IMAGE_URL = "image_url"
 
 
+_TEXT_T = MessageType.TEXT.value
+_USER_R = MessageRole.USER.value
+_ASSISTANT_R = MessageRole.ASSISTANT.value
+
+
 class Message(BaseModel):
     role: MessageRole
     content: list[dict[str, Any]]
@@ -31,7 +41,7 @@ class Message(BaseModel):
 
 class Usage(BaseModel):
     prompt_tokens: int
-    completion_tokens: int
+    completion_tokens: int | None
     total_tokens: int
 
 
@@ -44,15 +54,68 @@ class Response(BaseModel):
     structured_output: BaseModel | None = None
 
 
+@lru_cache(maxsize=64)
+def _schema_for(structured_output: type[BaseModel]) -> dict[str, Any]:
+    return structured_output.model_json_schema()
+
+
+def _construct_trusted(structured_output: type[BaseModel], text: str) -> BaseModel:
+    data = from_json(text)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    missing = [
+        name
+        for name, field in structured_output.model_fields.items()
+        if field.is_required() and name not in data
+    ]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    return structured_output.model_construct(**data)
+
+
+def _dump_messages(messages: list[Message] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [msg.model_dump() if isinstance(msg, Message) else msg for msg in messages]
+
+
 class Model:
-    def __init__(self, model: str, config: Config | None = None, retries: int = 2) -> None:
+    def __init__(
+        self,
+        model: str,
+        config: Config | None = None,
+        retries: int = 2,
+        trust_json: bool = False,
+    ) -> None:
+        from fireworks import Fireworks
+
+        load_env()
         api_key: str | None = os.environ.get("FIREWORKS_API_KEY")
         if not api_key:
             raise ValueError("FIREWORKS_API_KEY is not set")
         self.model = model
         self.config = config or Config()
         self.retries = retries
+        self.trust_json = trust_json
+        self._api_key = api_key
         self.client = Fireworks(api_key=api_key)
+        self._aclient: "AsyncFireworks | None" = None
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @config.setter
+    def config(self, config: Config) -> None:
+        self._config = config
+        self._config_dict = config.model_dump()
+
+    @property
+    def aclient(self) -> "AsyncFireworks":
+        # Created on first async use, so sync-only callers never build one.
+        if self._aclient is None:
+            from fireworks import AsyncFireworks
+
+            self._aclient = AsyncFireworks(api_key=self._api_key)
+        return self._aclient
 
     def _build_response(
         self,
@@ -66,63 +129,140 @@ class Model:
             message=Message(role=MessageRole(choice.role), content=content),
             reasoning_content=choice.reasoning_content,
             model=response.model,
-            usage=Usage.model_validate(vars(response.usage)),
+            usage=Usage.model_construct(**vars(response.usage)),
             structured_output=parsed_output,
         )
 
+    def _build_params(
+        self,
+        dumped_messages: list[dict[str, Any]],
+        structured_output: type[BaseModel] | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "model": self.model,
+            "messages": dumped_messages,
+        }
+        if structured_output:
+            params["response_format"] = {
+                "type": "json_object",
+                "schema": _schema_for(structured_output),
+            }
+        params.update(self._config_dict)
+        return params
+
+    def _handle_completion(
+        self,
+        response: Any,
+        dumped_messages: list[dict[str, Any]],
+        structured_output: type[BaseModel] | None,
+        is_last_attempt: bool,
+    ) -> Response | None:
+        choice = response.choices[0].message
+        content = choice.content
+        if isinstance(content, str):
+            content = [{"type": _TEXT_T, "text": content}]
+
+        if not structured_output:
+            return self._build_response(response, choice, content)
+
+        try:
+            if self.trust_json:
+                parsed = _construct_trusted(structured_output, content[0]["text"])
+            else:
+                parsed = structured_output.model_validate_json(content[0]["text"])
+        except ValueError as e:  # ValidationError, or a bad payload on the trusted path
+            if is_last_attempt:
+                raise
+            correction = (
+                f"Your previous response had a validation error: {e}. "
+                "Please correct your response to match the required format."
+            )
+            dumped_messages.append({"role": _ASSISTANT_R, "content": content})
+            dumped_messages.append({
+                "role": _USER_R,
+                "content": [{"type": _TEXT_T, "text": correction}],
+            })
+            return None
+        return self._build_response(response, choice, content, parsed)
+
     def invoke(
         self,
-        messages: list[Message],
+        messages: list[Message] | list[dict[str, Any]],
         structured_output: type[BaseModel] | None = None,
         retries: int | None = None,
     ) -> Response:
         retries = retries if retries is not None else self.retries
-        current_messages = list(messages)
+        dumped_messages = _dump_messages(messages)
 
         for attempt in range(retries):
-            params: dict[str, Any] = {
-                "model": self.model,
-                "messages": [msg.model_dump() for msg in current_messages],
-            }
-            if structured_output:
-                params["response_format"] = {
-                    "type": "json_object",
-                    "schema": structured_output.model_json_schema(),
-                }
-            params.update(self.config.model_dump())
-
+            params = self._build_params(dumped_messages, structured_output)
             response = self.client.chat.completions.create(**params)
-            choice = response.choices[0].message
-            content = choice.content
-            if isinstance(content, str):
-                content = [{"type": MessageType.TEXT.value, "text": content}]
+            result = self._handle_completion(
+                response, dumped_messages, structured_output, attempt == retries - 1
+            )
+            if result is not None:
+                return result
 
-            if not structured_output:
-                return self._build_response(response, choice, content)
+        raise RuntimeError("Retry loop completed without returning a response")
 
-            try:
-                parsed = structured_output.model_validate_json(content[0]["text"])
-                return self._build_response(response, choice, content, parsed)
-            except ValidationError as e:
-                if attempt < retries - 1:
-                    correction = (
-                        f"Your previous response had a validation error: {e}. "
-                        "Please correct your response to match the required format."
-                    )
-                    current_messages.append(
-                        Message(role=MessageRole.ASSISTANT, content=content)
-                    )
-                    current_messages.append(
-                        Message(
-                            role=MessageRole.USER,
-                            content=[{"type": MessageType.TEXT.value, "text": correction}],
-                        )
-                    )
-                    continue
-                raise
+    async def _ainvoke(
+        self,
+        client: "AsyncFireworks",
+        messages: list[Message] | list[dict[str, Any]],
+        structured_output: type[BaseModel] | None = None,
+        retries: int | None = None,
+    ) -> Response:
+        retries = retries if retries is not None else self.retries
+        dumped_messages = _dump_messages(messages)
+
+        for attempt in range(retries):
+            params = self._build_params(dumped_messages, structured_output)
+            response = await client.chat.completions.create(**params)
+            result = self._handle_completion(
+                response, dumped_messages, structured_output, attempt == retries - 1
+            )
+            if result is not None:
+                return result
 
         raise RuntimeError("Retry loop completed without returning a response")
 
+    async def ainvoke(
+        self,
+        messages: list[Message] | list[dict[str, Any]],
+        structured_output: type[BaseModel] | None = None,
+        retries: int | None = None,
+    ) -> Response:
+        return await self._ainvoke(self.aclient, messages, structured_output, retries)
+
+    def batch_invoke(
+        self,
+        batch: list[list[Message]] | list[list[dict[str, Any]]],
+        structured_output: type[BaseModel] | None = None,
+        retries: int | None = None,
+        concurrency: int = 16,
+    ) -> list[Response | Exception]:
+        from fireworks import AsyncFireworks
+
+        async def run() -> list[Response | Exception]:
+            semaphore = asyncio.Semaphore(concurrency)
+            # One client per run: its connections are bound to asyncio.run's event loop.
+            async with AsyncFireworks(api_key=self._api_key) as client:
+
+                async def bounded(
+                    messages: list[Message] | list[dict[str, Any]],
+                ) -> Response | Exception:
+                    async with semaphore:
+                        try:
+                            return await self._ainvoke(
+                                client, messages, structured_output, retries
+                            )
+                        except Exception as e:
+                            return e
+
+                return await asyncio.gather(*(bounded(messages) for messages in batch))
+
+        return asyncio.run(run())
+
 
 if __name__ == "__main__":
     # uv run python -m siliconcrowds.model
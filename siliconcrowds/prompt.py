@@ -1,9 +1,26 @@
 import re
+from functools import lru_cache
+from typing import Any
 
 from pydantic import BaseModel
 from datetime import datetime
 
-from siliconcrowds.model import Message, MessageRole, MessageType
+from siliconcrowds.model import MessageRole, MessageType
+
+_TEXT_T = MessageType.TEXT.value
+_IMG_T = MessageType.IMAGE_URL.value
+_SYSTEM_R = MessageRole.SYSTEM.value
+_USER_R = MessageRole.USER.value
+
+_IMAGE_RE = re.compile(r'\n*###IMAGE###\n.*?\n*')
+
+
+@lru_cache(maxsize=4096)
+def _format_user_prompt(template: str, transcript: str) -> str:
+    formatted_user_prompt = template.format(transcript=transcript, image="")
+    if "###IMAGE###" in formatted_user_prompt:
+        formatted_user_prompt = _IMAGE_RE.sub('', formatted_user_prompt)
+    return formatted_user_prompt.rstrip()
 
 
 class Persona(BaseModel):
@@ -32,6 +49,13 @@ class Prompt(BaseModel):
     template_name: str
     description: str | None
 
+    @property
+    def system_message(self) -> dict[str, Any]:
+        return {
+            "role": _SYSTEM_R,
+            "content": [{"type": _TEXT_T, "text": self.system_prompt}],
+        }
+
 
 class Question(BaseModel):
     id: int
@@ -49,9 +73,12 @@ class Instruction:
     def __init__(self) -> None:
         from siliconcrowds.database import Database
         database = Database()
-        self.baseline_prompts = database.get_baseline_prompts()
-        self.generic_persona_prompts = database.get_generic_persona_prompts()
-        self.specific_persona_prompts = database.get_specific_persona_prompts()
+        prompts = database.get_prompts_by_categories(
+            ["baseline", "generic_persona", "specific_persona"]
+        )
+        self.baseline_prompts = prompts["baseline"]
+        self.generic_persona_prompts = prompts["generic_persona"]
+        self.specific_persona_prompts = prompts["specific_persona"]
 
     def _get_prompt(self, prompts: dict[str, Prompt], prompt_name: str) -> Prompt:
         if prompt_name not in prompts:
@@ -68,26 +95,24 @@ class Instruction:
         return self._get_prompt(self.specific_persona_prompts, prompt_name)
 
     @staticmethod
-    def build_message(prompt: Prompt, transcript: str, image_url: str | None = None) -> list[Message]:
-        formatted_user_prompt = prompt.user_prompt.format(transcript=transcript, image="")
-        formatted_user_prompt = re.sub(r'\n*###IMAGE###\n.*?\n*', '', formatted_user_prompt).rstrip()
+    def build_message(
+        prompt: Prompt, transcript: str, image_url: str | None = None
+    ) -> list[dict[str, Any]]:
+        formatted_user_prompt = _format_user_prompt(prompt.user_prompt, transcript)
 
         messages = [
-            Message(
-                role=MessageRole.SYSTEM,
-                content=[{"type": MessageType.TEXT.value, "text": prompt.system_prompt}]
-            ),
-            Message(
-                role=MessageRole.USER,
-                content=[{"type": MessageType.TEXT.value, "text": formatted_user_prompt}]
-            ),
+            prompt.system_message,
+            {
+                "role": _USER_R,
+                "content": [{"type": _TEXT_T, "text": formatted_user_prompt}],
+            },
         ]
 
         if image_url:
-            messages.append(Message(
-                role=MessageRole.USER,
-                content=[{"type": MessageType.IMAGE_URL.value, "image_url": {"url": image_url}}]
-            ))
+            messages.append({
+                "role": _USER_R,
+                "content": [{"type": _IMG_T, "image_url": {"url": image_url}}],
+            })
 
         return messages
 
@@ -105,6 +130,6 @@ if __name__ == "__main__":
     ids: list[str] = contextual.get_ids()
     context: Context = contextual[ids[0]]
 
-    messages: list[Message] = Instruction.build_message(prompt, context.prompt.transcript, context.prompt.image_url)
+    messages: list[dict[str, Any]] = Instruction.build_message(prompt, context.prompt.transcript, context.prompt.image_url)
     print("================ Message: ==================")
     rich_print(messages)